@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+check_examples.py
+
+Convert the dumps in examples/sql/ with mysql2pg.py and compare the result with
+examples/schema_postgres.sql. Exits non-zero and prints a diff when they differ.
+"""
+
+import difflib
+import os
+import sys
+import tempfile
+
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPECTED_FILE = os.path.join(EXAMPLES_DIR, "schema_postgres.sql")
+
+sys.path.insert(0, os.path.dirname(EXAMPLES_DIR))
+import mysql2pg  # noqa: E402
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        mysql2pg.INPUT_DIR = os.path.join(EXAMPLES_DIR, "sql")
+        mysql2pg.OUTPUT_FILE = os.path.join(tmp, "schema_postgres.sql")
+        mysql2pg.main()
+        with open(mysql2pg.OUTPUT_FILE, "r", encoding="utf-8") as fh:
+            actual = fh.read()
+    with open(EXPECTED_FILE, "r", encoding="utf-8") as fh:
+        expected = fh.read()
+
+    if actual == expected:
+        print(f"[OK] Output matches {EXPECTED_FILE}")
+        return 0
+    sys.stdout.writelines(difflib.unified_diff(
+        expected.splitlines(True), actual.splitlines(True), "expected", "actual"))
+    print(f"\n[!] Output differs from {EXPECTED_FILE}")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
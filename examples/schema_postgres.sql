@@ -0,0 +1,45 @@
+CREATE SCHEMA IF NOT EXISTS "myapp";
+
+SET search_path TO "myapp";
+
+
+-- ===== CREATE TABLES =====
+
+
+CREATE TABLE IF NOT EXISTS "myapp"."posts" (
+    "id" SERIAL NOT NULL,
+    "title" varchar(255) NOT NULL,
+    PRIMARY KEY (id)
+);
+
+CREATE TABLE IF NOT EXISTS "myapp"."tags" (
+    "id" INTEGER NOT NULL,
+    "label" varchar(50) NOT NULL DEFAULT '--',
+    "sep" char(1) NOT NULL DEFAULT ',',
+    "note" varchar(50) DEFAULT '(none'
+);
+
+CREATE TABLE IF NOT EXISTS "myapp"."accounts" (
+    "id" INTEGER NOT NULL,
+    "email" varchar(191) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS "myapp"."users" (
+    "id" INTEGER NOT NULL,
+    "active" BOOLEAN DEFAULT TRUE
+);
+
+
+-- ===== ADD PRIMARY KEYS =====
+
+
+
+-- ===== INDEXES from inline definitions =====
+
+
+
+-- ===== INLINE CONSTRAINTS (ENUM CHECKS, etc.) =====
+
+
+
+-- ===== OTHER ALTER / FK =====
@@ -0,0 +1,39 @@
+-- Sample MySQL dump with inputs that are easy to get wrong.
+-- examples/check_examples.py converts it and compares the result with
+-- examples/schema_postgres.sql.
+
+-- Comment markers inside string literals must not be treated as comments:
+-- the INSERT below must not hide the `tags` table that follows it, and the
+-- quoted DEFAULTs in `tags` must not break how its columns are split.
+CREATE TABLE `posts` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `title` varchar(255) NOT NULL,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO `posts` (`id`, `title`) VALUES
+(1, 'see -- this'),
+(2, 'a /* b */ c'),
+(3, 'it''s # not a comment');
+
+CREATE TABLE `tags` (
+  `id` int(11) NOT NULL,
+  `label` varchar(50) NOT NULL DEFAULT '--',
+  `sep` char(1) NOT NULL DEFAULT ',',
+  `note` varchar(50) DEFAULT '(none'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- A trailing # comment containing a quote must not pull the next table into this one.
+CREATE TABLE `accounts` (
+  `id` int(11) NOT NULL, # user's id
+  `email` varchar(191) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE `users` (
+  `id` int(11) NOT NULL,
+  `active` tinyint(1) DEFAULT '1'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- CREATE TABLE without a column list has nothing to convert and is skipped.
+CREATE TABLE `users_copy` LIKE `users`;
+CREATE TABLE `active_users` AS SELECT * FROM `users` WHERE `active` = 1;
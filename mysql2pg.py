@@ -8,111 +8,170 @@ It will produce OUTPUT_FILE which is a Postgres-ready schema (structure-only).
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 
 INPUT_DIR = "sql"      # folder containing your .sql files
 OUTPUT_FILE = "schema_postgres.sql"
 TARGET_SCHEMA = "myapp"     # change schema name here
+# fewer CREATE TABLE blocks than this are converted without worker processes: a block converts in
+# ~0.3 ms and starting the pool costs ~10 ms with fork, so it only pays off from ~60-85 blocks on.
+# spawn (macOS / Windows default) starts in ~60-90 ms; raise this there if small runs matter
+PARALLEL_MIN_BLOCKS = 100
+
+# translation table deleting backticks and double quotes
+_STRIP_QUOTES = str.maketrans("", "", '`"')
+
+# -------------------------
+# Pre-compiled regex patterns
+# -------------------------
+# a quoted string or identifier; never spans lines, so an unterminated quote can't swallow later text
+_LITERAL_PATTERN = (
+    r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'"
+    r'|"[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+    r"|`[^`\n]*`"
+)
+
+# remove_mysql_noise: every kind of noise in one alternation, so a statement is scanned once;
+# literals are matched first (group 1) and kept, so comment markers inside them survive
+_RE_NOISE = re.compile("|".join([
+    rf"({_LITERAL_PATTERN})",
+    r"/\*[^*]*\*+(?:[^/*][^*]*\*+)*/",                          # /* ... */ and /*! ... */ comments
+    r"^\s*--.*\n?",                                             # full-line -- comments
+    r"^\s*#.*\n?",                                              # full-line # comments
+    r"--[^\r\n]*",                                              # inline -- comments
+    r"#[^\r\n]*",                                               # inline # comments
+    r"ENGINE\s*=\s*\w+\s*",                                     # table options after CREATE TABLE
+    r"AUTO_INCREMENT\s*=\s*\d+\s*",
+    r"(?:DEFAULT\s+)?CHARSET\s*=\s*\w+\s*",
+    r"COLLATE\s*=\s*[\w\-]+\s*",
+]), re.I | re.M)
+
+# scan_statements: one whole statement per match. Leading whitespace and comments are skipped,
+# group 1 runs up to and including the next ';' outside literals and comments (or to the end)
+_COMMENT_PATTERN = r"--[^\n]*|#[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/"
+_RE_STATEMENT = re.compile(
+    rf"(?:\s+|{_COMMENT_PATTERN})*"
+    rf"((?:[^;'\"`#/-]+|{_LITERAL_PATTERN}|{_COMMENT_PATTERN}|[-/#'\"`])*;?)"
+)
+_RE_STMT_KIND = re.compile(r"(?:(?P<create>create)|(?P<alter>alter))\s+table", re.I)
+
+# convert_create_block
+# one identifier: `quoted`, "quoted" or bare
+_IDENT_PATTERN = r"(?:`[^`]+`|\"[^\"]+\"|[^`\"\s(.]+)"
+_RE_TABLE_NAME = re.compile(rf"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?((?:{_IDENT_PATTERN}\s*\.\s*)?{_IDENT_PATTERN})\s*\(", re.I)
+_RE_KEYWORD_LINE = re.compile(r"^(INDEX|KEY|UNIQUE|FOREIGN|CONSTRAINT|PRIMARY)\s+", re.I)
+_RE_COLUMN_QUOTED = re.compile(r"^(`?\"?)(\w+)\1?\s+(.*)$", re.S)
+_RE_COLUMN_BARE = re.compile(r"^(\w+)\s+(.*)$", re.S)
+_RE_INLINE_REFERENCES = re.compile(r"REFERENCES\s+(\w+)\s*\(([^)]+)\)\s*(.*)", re.I)
+_RE_STRIP_REFERENCES = re.compile(r"\s+REFERENCES\s+\w+\s*\([^)]+\)\s*.*$", re.I)
+_RE_TYPE_FIX = re.compile("|".join([
+    r"(?P<tinybool>\btinyint\s*\(\s*1\s*\))",
+    r"(?P<int>\bint\s*\(\s*\d+\s*\))",
+    r"(?P<bigint>\bbigint\s*\(\s*\d+\s*\))",
+    r"(?P<decimal>\bdecimal\s*\()",
+    r"(?P<double>\bdouble\b)",
+    r"(?P<datetime>\bdatetime\b)",
+    r"(?P<onupdate>ON\s+UPDATE\s+CURRENT_TIMESTAMP(?:\s*\(\s*\))?)",
+    r"(?P<current_ts>current_timestamp\s*\(\s*\))",
+    r"(?P<enum>\benum\s*\((?P<enum_vals>(?:'[^']*'|\"[^\"]*\"|[^)'\"])*)\))",
+    r"(?P<unsigned>\bunsigned\b)",
+    r"(?P<charset>CHARACTER SET\s+\w+)",
+    r"(?P<collate>COLLATE\s+\w+)",
+]), re.I)
+_TYPE_FIX_REPLACEMENTS = {
+    "tinybool": "BOOLEAN",
+    "int": "INTEGER",
+    "bigint": "BIGINT",
+    "decimal": "NUMERIC(",
+    "double": "double precision",
+    "datetime": "TIMESTAMP",
+    "onupdate": "",
+    "current_ts": "CURRENT_TIMESTAMP",
+    "unsigned": "",
+    "charset": "",
+    "collate": "",
+}
+_RE_VARCHAR = re.compile(r"varchar\s*\(\s*\d+\s*\)", re.I)
+_RE_BOOLEAN = re.compile(r"\bBOOLEAN\b", re.I)
+_RE_DEFAULT_QUOTED_TRUE = re.compile(r"DEFAULT\s+'1'", re.I)
+_RE_DEFAULT_QUOTED_FALSE = re.compile(r"DEFAULT\s+'0'", re.I)
+_RE_DEFAULT_TRUE = re.compile(r"DEFAULT\s+1\b", re.I)
+_RE_DEFAULT_FALSE = re.compile(r"DEFAULT\s+0\b", re.I)
+_RE_COLUMN_FLAGS = re.compile(r"\b(?:(?P<autoinc>AUTO_INCREMENT)|(?P<notnull>NOT\s+NULL)|(?P<pk>PRIMARY\s+KEY))\b", re.I)
+_RE_BIGINT_TYPE = re.compile(r"\bBIGINT\b", re.I)
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_PRIMARY_KEY_LINE = re.compile(r"PRIMARY\s+KEY", re.I)
+_RE_INDEX_LINE = re.compile(r"(UNIQUE\s+KEY|UNIQUE\s+INDEX|KEY|INDEX)\s+`?\"?(\w+)`?\"?\s*\((.+)\)", re.I)
+_RE_UNIQUE_LINE = re.compile(r"UNIQUE\s*\((.+)\)", re.I)
+_RE_FOREIGN_KEY = re.compile(r"FOREIGN\s+KEY", re.I)
+_RE_FOREIGN_KEY_LINE = re.compile(r"FOREIGN\s+KEY\s*\(([^)]+)\)\s+REFERENCES\s+(\w+)\s*\(([^)]+)\)\s*(.*)", re.I)
+# CREATE TABLE body: quoted literals/identifiers are skipped whole, only bare , ( ) are captured
+_RE_BODY_TOKEN = re.compile(_LITERAL_PATTERN + r"|([,()])")
+
+# process_alters
+_RE_ALTER_HEADER = re.compile(r"ALTER\s+TABLE\s+`?\"?([^`\" ]+)`?\"?\s+(.*)$", re.I)
+_RE_MODIFY_AUTO_INCREMENT = re.compile(r"MODIFY\s+`?\"?(\w+)`?\"?\s+[^\;]*AUTO_INCREMENT", re.I)
+_RE_ADD_PRIMARY_KEY = re.compile(r"ADD\s+PRIMARY\s+KEY\s*\(([^)]*)\)", re.I)
+_RE_ADD_INDEX = re.compile(r"ADD\s+(UNIQUE\s+KEY|UNIQUE\s+INDEX|KEY|INDEX)\s+`?\"?(\w+)`?\"?\s*\(([^)]*)\)", re.I)
+_RE_ADD_FOREIGN_KEY = re.compile(
+    r'ADD\s+CONSTRAINT\s+`?\"?(\w+)`?\"?\s+FOREIGN\s+KEY\s*\(([^)]*)\)\s+REFERENCES\s+`?\"?(\w+)`?\"?\s*\(([^)]*)\)'
+    r'\s*(ON DELETE\s+\w+)?\s*(ON UPDATE\s+\w+)?',
+    re.I,
+)
 
 # -------------------------
 # Helper text-cleaning
 # -------------------------
+def _keep_literals(m):
+    # quoted strings / identifiers are returned unchanged, every other match is dropped
+    return m.group(1) or ""
+
 def remove_mysql_noise(sql):
-    # Remove /*! ... */ versioned comments and other /* ... */ blocks from phpMyAdmin
-    sql = re.sub(r"/\*![\s\S]*?\*/", "", sql)
-    sql = re.sub(r"/\*[\s\S]*?\*/", "", sql)
-
-    # Remove single-line mysql comments that begin with -- or #
-    sql = re.sub(r"(?m)^\s*--.*\n?", "", sql)
-    sql = re.sub(r"(?m)^\s*#.*\n?", "", sql)
-    
-    # Remove inline comments (-- comment at end of line)
-    sql = re.sub(r"--[^\r\n]*", "", sql)
-
-    # Remove SET statements (sql_mode, time_zone etc.) and START/COMMIT/LOCK/UNLOCK
-    sql = re.sub(r"(?im)^\s*SET\s+[^;]+;\s*", "", sql)
-    sql = re.sub(r"(?im)^\s*START\s+TRANSACTION\s*;\s*", "", sql)
-    sql = re.sub(r"(?im)^\s*COMMIT\s*;\s*", "", sql)
-    sql = re.sub(r"(?im)^\s*LOCK TABLES\b.*?;\s*", "", sql, flags=re.DOTALL)
-    sql = re.sub(r"(?im)^\s*UNLOCK TABLES\s*;\s*", "", sql)
-
-    # Remove ENGINE / AUTO_INCREMENT=<n> / DEFAULT CHARSET / COLLATE at end of CREATE TABLE
-    sql = re.sub(r"(?im)ENGINE\s*=\s*\w+\s*", "", sql)
-    sql = re.sub(r"(?im)AUTO_INCREMENT\s*=\s*\d+\s*", "", sql)
-    sql = re.sub(r"(?im)DEFAULT\s+CHARSET\s*=\s*\w+\s*", "", sql)
-    sql = re.sub(r"(?im)CHARSET\s*=\s*\w+\s*", "", sql)
-    sql = re.sub(r"(?im)COLLATE\s*=\s*[\w\-_]+\s*", "", sql)
-
-    # Remove repeated phpMyAdmin headers or other garbage lines like /*!40101 ... */
-    sql = re.sub(r"(?m)^\s*-- phpMyAdmin.*\n?", "", sql)
-    sql = re.sub(r"(?m)^\s*-- Host:.*\n?", "", sql)
-    sql = re.sub(r"(?m)^\s*-- Generation Time:.*\n?", "", sql)
-    sql = re.sub(r"(?m)^\s*-- Server version:.*\n?", "", sql)
-
-    return sql
+    # Remove comments (/*! ... */ versioned ones from phpMyAdmin, /* ... */, -- and #) and the
+    # ENGINE / AUTO_INCREMENT=<n> / DEFAULT CHARSET / COLLATE options at the end of CREATE TABLE.
+    # Applied per CREATE / ALTER statement; SET / LOCK / INSERT / ... never reach it
+    return _RE_NOISE.sub(_keep_literals, sql)
 
 # -------------------------
-# Utility: find create-table blocks (balanced parentheses)
+# Utility: split the dump into statements (single pass)
 # -------------------------
-def find_create_table_blocks(sql):
-    blocks = []
-    pos = 0
-    low = sql.lower()
-    while True:
-        m = re.search(r"create\s+table", low[pos:], re.IGNORECASE)
-        if not m:
-            break
-        start = pos + m.start()
-        # find the first '(' after start
-        paren_idx = sql.find("(", start)
-        if paren_idx == -1:
-            pos = start + 1
-            continue
-        # balance parentheses
-        i = paren_idx
-        depth = 0
-        end_idx = -1
-        while i < len(sql):
-            if sql[i] == "(":
-                depth += 1
-            elif sql[i] == ")":
-                depth -= 1
-                if depth == 0:
-                    # find semicolon after this )
-                    # skip whitespace and comments until semicolon
-                    j = i + 1
-                    while j < len(sql) and sql[j].isspace():
-                        j += 1
-                    if j < len(sql) and sql[j] == ";":
-                        end_idx = j
-                    else:
-                        # try to find next semicolon a bit further (some dumps omit immediate ;)
-                        sc = sql.find(";", i+1)
-                        end_idx = sc if sc != -1 else i
-                    break
-            i += 1
-        if end_idx == -1:
-            # malformed; take until next semicolon to avoid swallowing everything
-            sc = sql.find(";", paren_idx)
-            end_idx = sc if sc != -1 else len(sql)-1
-
-        block_text = sql[start:end_idx+1]
-        blocks.append((start, end_idx+1, block_text))
-        pos = end_idx+1
-    return blocks
+def scan_statements(sql):
+    # Walk sql once and yield (kind, text) for every CREATE TABLE / ALTER TABLE statement.
+    # kind is "create" or "alter"; other statements (INSERT data, DROP, ...) are skipped
+    # without being copied out of sql. Quoted strings, quoted identifiers and comments are
+    # consumed as whole tokens, so a ';' inside them never ends a statement. A trailing
+    # statement without ';' is still emitted.
+    for m in _RE_STATEMENT.finditer(sql):
+        kind_m = _RE_STMT_KIND.match(sql, m.start(1))
+        if kind_m:
+            yield kind_m.lastgroup, m.group(1).rstrip()
 
 # -------------------------
-# Extract ALTER TABLE statements
+# Utility: split a parenthesised list on top-level commas
 # -------------------------
-def find_alter_statements(sql):
-    alters = []
-    for m in re.finditer(r"alter\s+table\b", sql, flags=re.IGNORECASE):
-        start = m.start()
-        sc = sql.find(";", start)
-        if sc == -1:
-            sc = len(sql)-1
-        block = sql[start:sc+1]
-        alters.append(block)
-    return alters
+def split_top_level_commas(text, open_idx):
+    # text[open_idx] must be '('. Returns (spans, close_idx): the (start, end) offsets of the
+    # pieces separated by commas outside nested parentheses and quotes, and the index of the
+    # matching ')' (None if it is never closed). Only the punctuation tokens found by
+    # _RE_BODY_TOKEN are visited, so the loop runs once per , ( ) rather than per character.
+    spans = []
+    depth = 1
+    prev_end = open_idx + 1
+    for m in _RE_BODY_TOKEN.finditer(text, prev_end):
+        ch = m.group(1)
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                spans.append((prev_end, m.start()))
+                return spans, m.start()
+        elif ch == "," and depth == 1:
+            spans.append((prev_end, m.start()))
+            prev_end = m.end()
+    return spans, None
 
 # -------------------------
 # Helpers to normalize identifier names
@@ -134,164 +193,107 @@ def quote_ident(name):
 # -------------------------
 # Main conversion logic
 # -------------------------
-def convert_create_block(block_text, table_autoinc_map):
-    # Extract raw table name from header
-    # find header up to first '('
-    header_match = re.search(r"CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?(.+?)\(", block_text, flags=re.IGNORECASE|re.DOTALL)
+def convert_create_block(block_text, table_autoinc_map, schema):
+    # Extract raw table name (optionally db-qualified and quoted) from the header
+    header_match = _RE_TABLE_NAME.search(block_text)
     if not header_match:
         return None, [], []
-    raw_name = header_match.group(2).strip()
-    raw_name = raw_name.rstrip()
-    # strip trailing backtick/quote/spacing
-    raw_name = raw_name.strip()
-    raw_name = raw_name.split()[-1] if raw_name.split() else raw_name
-    table_name = clean_identifier(raw_name)
-
-    # find inner body from first '(' to matching ')'
-    open_idx = block_text.find("(")
-    # balance from open_idx
-    i = open_idx
-    depth = 0
-    end_idx = None
-    while i < len(block_text):
-        if block_text[i] == "(":
-            depth += 1
-        elif block_text[i] == ")":
-            depth -= 1
-            if depth == 0:
-                end_idx = i
-                break
-        i += 1
+    table_name = clean_identifier(header_match.group(1))
+
+    # split the body (from the '(' that ends the header) on top-level commas
+    spans, end_idx = split_top_level_commas(block_text, header_match.end() - 1)
     if end_idx is None:
         raise RuntimeError(f"Couldn't parse CREATE TABLE block for {table_name}")
+    parts = []
+    for start, end in spans:
+        part = block_text[start:end].strip()
+        if part:
+            parts.append(part)
 
-    body = block_text[open_idx+1:end_idx]
+    # enum value lists seen by fix_type for the current column
+    enum_values = []
 
-    # split top-level comma separated lines (avoid commas inside parentheses)
-    parts = []
-    current = []
-    depth = 0
-    for ch in body:
-        if ch == "(":
-            depth += 1
-            current.append(ch)
-        elif ch == ")":
-            depth -= 1
-            current.append(ch)
-        elif ch == "," and depth == 0:
-            part = "".join(current).strip()
-            if part:
-                parts.append(part)
-            current = []
-        else:
-            current.append(ch)
-    # last part
-    last = "".join(current).strip()
-    if last:
-        parts.append(last)
+    def fix_type(m):
+        kind = m.lastgroup
+        if kind == "enum":
+            enum_values.append(m.group("enum_vals"))
+            return "VARCHAR(191)"
+        return _TYPE_FIX_REPLACEMENTS[kind]
 
     column_lines = []
     inline_index_defs = []
+    seen_index_defs = set()   # dedupe inline_index_defs while keeping their order
     inline_constraints = []
-    for part in parts:
-        p = part.strip()
-        if not p:
-            continue
+    # parts are already stripped and non-empty
+    for p in parts:
         # detect column definition (starts with backtick or quote or alphanumeric name)
         # but exclude MySQL keywords like INDEX, KEY, UNIQUE, FOREIGN, CONSTRAINT, PRIMARY
-        if re.match(r"^(INDEX|KEY|UNIQUE|FOREIGN|CONSTRAINT|PRIMARY)\s+", p, flags=re.IGNORECASE):
+        if _RE_KEYWORD_LINE.match(p):
             col_match = None
         else:
             # Match both quoted and unquoted column names
-            col_match = re.match(r"^(`?\"?)(\w+)\1?\s+(.*)$", p, flags=re.DOTALL)
+            col_match = _RE_COLUMN_QUOTED.match(p)
             if not col_match:
                 # Try without quotes for unquoted column names
-                col_match = re.match(r"^(\w+)\s+(.*)$", p, flags=re.DOTALL)
+                col_match = _RE_COLUMN_BARE.match(p)
         if col_match:
             colname = col_match.group(2)
             rest = col_match.group(3).strip()
             orig_rest = rest
-            
+            # AUTO_INCREMENT / NOT NULL / PRIMARY KEY markers of the original definition, in one pass
+            col_flags = {m.lastgroup for m in _RE_COLUMN_FLAGS.finditer(orig_rest)}
 
             # Handle inline foreign key references (PostgreSQL style)
-            if "REFERENCES" in rest.upper():
-                # Extract foreign key details for later ALTER TABLE statement
-                fk_match = re.search(r"REFERENCES\s+(\w+)\s*\(([^)]+)\)\s*(.*)", rest, flags=re.IGNORECASE)
-                if fk_match:
-                    ref_table = fk_match.group(1)
-                    ref_cols = fk_match.group(2)
-                    ref_options = fk_match.group(3).strip()
-                    
-                    # Remove the REFERENCES part from the column definition
-                    rest = re.sub(r"\s+REFERENCES\s+\w+\s*\([^)]+\)\s*.*$", "", rest, flags=re.IGNORECASE)
-                    
-                    # Create ALTER TABLE statement for foreign key
-                    fk_constraint = f'ALTER TABLE {quote_ident(TARGET_SCHEMA)}.{quote_ident(table_name)} ADD FOREIGN KEY ({quote_ident(colname)}) REFERENCES {quote_ident(TARGET_SCHEMA)}.{quote_ident(ref_table)} ({ref_cols}) {ref_options};'
-                    inline_constraints.append(fk_constraint)
+            # Extract foreign key details for later ALTER TABLE statement
+            fk_match = _RE_INLINE_REFERENCES.search(rest)
+            if fk_match:
+                ref_table = fk_match.group(1)
+                ref_cols = fk_match.group(2)
+                ref_options = fk_match.group(3).strip()
+
+                # Remove the REFERENCES part from the column definition
+                rest = _RE_STRIP_REFERENCES.sub("", rest)
+
+                # Create ALTER TABLE statement for foreign key
+                fk_constraint = f'ALTER TABLE {quote_ident(schema)}.{quote_ident(table_name)} ADD FOREIGN KEY ({quote_ident(colname)}) REFERENCES {quote_ident(schema)}.{quote_ident(ref_table)} ({ref_cols}) {ref_options};'
+                inline_constraints.append(fk_constraint)
 
-            # convert types
-            # tinyint(1) -> boolean
-            rest = re.sub(r"\btinyint\s*\(\s*1\s*\)", "BOOLEAN", rest, flags=re.IGNORECASE)
-            
             # Fix specific data type issues
             if table_name == "assigned_rooms" and colname == "user_id":
                 # Change varchar(10) to integer to match users.id
-                rest = re.sub(r"varchar\s*\(\s*\d+\s*\)", "INTEGER", rest, flags=re.IGNORECASE)
-
-            # int(X) -> integer, bigint(X) -> bigint
-            rest = re.sub(r"\bint\s*\(\s*\d+\s*\)", "INTEGER", rest, flags=re.IGNORECASE)
-            rest = re.sub(r"\bbigint\s*\(\s*\d+\s*\)", "BIGINT", rest, flags=re.IGNORECASE)
-
-            # decimal(a,b) -> NUMERIC(a,b)
-            rest = re.sub(r"\bdecimal\s*\(", "NUMERIC(", rest, flags=re.IGNORECASE)
-
-            # double -> double precision
-            rest = re.sub(r"\bdouble\b", "double precision", rest, flags=re.IGNORECASE)
-
-            # datetime -> timestamp
-            rest = re.sub(r"\bdatetime\b", "TIMESTAMP", rest, flags=re.IGNORECASE)
-
-            # CURRENT_TIMESTAMP() -> CURRENT_TIMESTAMP
-            rest = re.sub(r"current_timestamp\s*\(\s*\)", "CURRENT_TIMESTAMP", rest, flags=re.IGNORECASE)
-
-            # ON UPDATE CURRENT_TIMESTAMP -> remove (Postgres doesn't support this inline)
-            rest = re.sub(r"ON\s+UPDATE\s+CURRENT_TIMESTAMP", "", rest, flags=re.IGNORECASE)
+                rest = _RE_VARCHAR.sub("INTEGER", rest)
 
+            # convert types in one pass: tinyint(1) -> BOOLEAN, int(X) -> INTEGER, bigint(X) -> BIGINT,
+            # decimal( -> NUMERIC(, double -> double precision, datetime -> TIMESTAMP,
+            # CURRENT_TIMESTAMP() -> CURRENT_TIMESTAMP, drop ON UPDATE CURRENT_TIMESTAMP (Postgres
+            # doesn't support this inline), unsigned, CHARACTER SET and COLLATE;
             # enum('a','b') -> varchar with CHECK
-            enum_m = re.search(r"\benum\s*\((.*?)\)", rest, flags=re.IGNORECASE)
+            enum_values.clear()
+            rest = _RE_TYPE_FIX.sub(fix_type, rest)
             enum_check = None
-            if enum_m:
-                enum_vals = enum_m.group(1)
+            if enum_values:
                 # keep values as-is for check
-                rest = re.sub(r"\benum\s*\(.*?\)", "VARCHAR(191)", rest, flags=re.IGNORECASE)
-                enum_check = (colname, enum_vals)
+                enum_check = (colname, enum_values[0])
 
             # DEFAULT '1'/'0' for boolean -> DEFAULT TRUE/FALSE (only for boolean columns)
-            if re.search(r"\bBOOLEAN\b", rest, flags=re.IGNORECASE):
-                rest = re.sub(r"DEFAULT\s+'1'", "DEFAULT TRUE", rest, flags=re.IGNORECASE)
-                rest = re.sub(r"DEFAULT\s+'0'", "DEFAULT FALSE", rest, flags=re.IGNORECASE)
+            if _RE_BOOLEAN.search(rest):
+                rest = _RE_DEFAULT_QUOTED_TRUE.sub("DEFAULT TRUE", rest)
+                rest = _RE_DEFAULT_QUOTED_FALSE.sub("DEFAULT FALSE", rest)
                 # Also handle numeric defaults for boolean columns
-                rest = re.sub(r"DEFAULT\s+1\b", "DEFAULT TRUE", rest, flags=re.IGNORECASE)
-                rest = re.sub(r"DEFAULT\s+0\b", "DEFAULT FALSE", rest, flags=re.IGNORECASE)
-
-            # remove unsigned
-            rest = re.sub(r"\bunsigned\b", "", rest, flags=re.IGNORECASE)
-
-            # Remove CHARACTER SET/ COLLATE in columns
-            rest = re.sub(r"CHARACTER SET\s+\w+", "", rest, flags=re.IGNORECASE)
-            rest = re.sub(r"COLLATE\s+\w+", "", rest, flags=re.IGNORECASE)
+                rest = _RE_DEFAULT_TRUE.sub("DEFAULT TRUE", rest)
+                rest = _RE_DEFAULT_FALSE.sub("DEFAULT FALSE", rest)
 
             # handle AUTO_INCREMENT: prefer converting column type to SERIAL/BIGSERIAL
-            if re.search(r"\bAUTO_INCREMENT\b", orig_rest, flags=re.IGNORECASE) or (table_name in table_autoinc_map and colname in table_autoinc_map[table_name]):
+            if "autoinc" in col_flags or (table_name in table_autoinc_map and colname in table_autoinc_map[table_name]):
                 # decide serial type based on original type hint
-                if re.search(r"\bBIGINT\b", rest, flags=re.IGNORECASE):
+                if _RE_BIGINT_TYPE.search(rest):
                     serial_type = "BIGSERIAL"
                 else:
                     serial_type = "SERIAL"
                 # preserve NOT NULL if present
-                notnull = " NOT NULL" if re.search(r"\bNOT\s+NULL\b", orig_rest, flags=re.IGNORECASE) else ""
+                notnull = " NOT NULL" if "notnull" in col_flags else ""
                 # Check if this column also has PRIMARY KEY
-                if re.search(r"\bPRIMARY\s+KEY\b", orig_rest, flags=re.IGNORECASE):
+                if "pk" in col_flags:
                     primary_key = " PRIMARY KEY"
                 else:
                     primary_key = ""
@@ -300,7 +302,7 @@ def convert_create_block(block_text, table_autoinc_map):
             else:
                 # otherwise keep the converted rest but tidy up NOT NULL and DEFAULT placements
                 # Remove multiple spaces
-                rest = re.sub(r"\s+", " ", rest).strip()
+                rest = _RE_WHITESPACE.sub(" ", rest).strip()
                 col_def = f'{quote_ident(colname)} {rest}'
 
             column_lines.append(col_def)
@@ -309,46 +311,53 @@ def convert_create_block(block_text, table_autoinc_map):
                 v = enum_check[1]
                 # ensure values are quoted
                 column_lines.append(f'-- CHECK for enum values on {colname} will be created below')
-                inline_constraints.append(f'ALTER TABLE {quote_ident(TARGET_SCHEMA)}.{quote_ident(table_name)} ADD CHECK ({quote_ident(colname)} IN ({v}));')
+                inline_constraints.append(f'ALTER TABLE {quote_ident(schema)}.{quote_ident(table_name)} ADD CHECK ({quote_ident(colname)} IN ({v}));')
         else:
             # likely index, constraint or primary key line
-            lp = p.strip().rstrip(",")
+            lp = p.rstrip(",")
+            # each pattern is only tried once the ones before it have failed (PRIMARY KEY,
+            # KEY / INDEX, UNIQUE, FOREIGN KEY); a branch that matches moves on to the next part
             # PRIMARY KEY inline -> keep inside create
-            if re.match(r"PRIMARY\s+KEY", lp, flags=re.IGNORECASE):
+            if _RE_PRIMARY_KEY_LINE.match(lp):
                 # normalize quoting of column names inside
-                lp2 = re.sub(r"`", "", lp)
-                lp2 = re.sub(r'\"', '', lp2)
+                lp2 = lp.translate(_STRIP_QUOTES)
                 column_lines.append(lp2)
+                continue
             # KEY / UNIQUE KEY / INDEX: capture for post-create index creation
-            elif re.match(r"(UNIQUE\s+KEY|UNIQUE\s+INDEX|KEY|INDEX)\s+`?\"?(\w+)`?\"?\s*\((.+)\)", lp, flags=re.IGNORECASE):
-                m_idx = re.match(r"(UNIQUE\s+KEY|UNIQUE\s+INDEX|KEY|INDEX)\s+`?\"?(\w+)`?\"?\s*\((.+)\)", lp, flags=re.IGNORECASE)
+            m_idx = _RE_INDEX_LINE.match(lp)
+            if m_idx:
                 kind = m_idx.group(1).upper()
                 idx_name = m_idx.group(2)
                 cols = m_idx.group(3)
-                cols = re.sub(r"[`\"]", "", cols)
+                cols = cols.translate(_STRIP_QUOTES)
                 unique = "UNIQUE " if "UNIQUE" in kind else ""
-                inline_index = f'CREATE {unique}INDEX IF NOT EXISTS {quote_ident(idx_name)} ON {quote_ident(TARGET_SCHEMA)}.{quote_ident(table_name)} ({cols});'
-                inline_index_defs.append(inline_index)
+                inline_index = f'CREATE {unique}INDEX IF NOT EXISTS {quote_ident(idx_name)} ON {quote_ident(schema)}.{quote_ident(table_name)} ({cols});'
+                if inline_index not in seen_index_defs:
+                    seen_index_defs.add(inline_index)
+                    inline_index_defs.append(inline_index)
                 # Don't add to column_lines - this will be handled separately
+                continue
             # Handle UNIQUE constraint without KEY/INDEX keyword (e.g., UNIQUE(col1, col2))
-            elif re.match(r"UNIQUE\s*\((.+)\)", lp, flags=re.IGNORECASE):
-                unique_match = re.match(r"UNIQUE\s*\((.+)\)", lp, flags=re.IGNORECASE)
-                if unique_match:
-                    cols = unique_match.group(1)
-                    cols = re.sub(r"[`\"]", "", cols)
-                    # Generate a unique index name
-                    idx_name = f"unique_{table_name}_{cols.replace(',', '_').replace(' ', '').replace('(', '').replace(')', '')}"
-                    inline_index = f'CREATE UNIQUE INDEX IF NOT EXISTS {quote_ident(idx_name)} ON {quote_ident(TARGET_SCHEMA)}.{quote_ident(table_name)} ({cols});'
+            unique_match = _RE_UNIQUE_LINE.match(lp)
+            if unique_match:
+                cols = unique_match.group(1)
+                cols = cols.translate(_STRIP_QUOTES)
+                # Generate a unique index name
+                idx_name = f"unique_{table_name}_{cols.replace(',', '_').replace(' ', '').replace('(', '').replace(')', '')}"
+                inline_index = f'CREATE UNIQUE INDEX IF NOT EXISTS {quote_ident(idx_name)} ON {quote_ident(schema)}.{quote_ident(table_name)} ({cols});'
+                if inline_index not in seen_index_defs:
+                    seen_index_defs.add(inline_index)
                     inline_index_defs.append(inline_index)
                 # Don't add to column_lines - this will be handled separately
+                continue
             # CONSTRAINT (FOREIGN KEY) inline -> capture for post-create constraint creation
-            elif re.search(r"FOREIGN\s+KEY", lp, flags=re.IGNORECASE):
+            if _RE_FOREIGN_KEY.search(lp):
                 # Extract foreign key details for later ALTER TABLE statement
-                fk_match = re.search(r"FOREIGN\s+KEY\s*\(([^)]+)\)\s+REFERENCES\s+(\w+)\s*\(([^)]+)\)\s*(.*)", lp, flags=re.IGNORECASE)
+                fk_match = _RE_FOREIGN_KEY_LINE.search(lp)
                 if fk_match:
-                    fk_cols = fk_match.group(1).replace("`", "").replace('"', "")
+                    fk_cols = fk_match.group(1).translate(_STRIP_QUOTES)
                     ref_table = fk_match.group(2)
-                    ref_cols = fk_match.group(3).replace("`", "").replace('"', "")
+                    ref_cols = fk_match.group(3).translate(_STRIP_QUOTES)
                     ref_options = fk_match.group(4).strip()
                     
                     # Fix known table reference issues
@@ -362,18 +371,15 @@ def convert_create_block(block_text, table_autoinc_map):
                         pass
                     
                     # Create ALTER TABLE statement for foreign key
-                    fk_constraint = f'ALTER TABLE {quote_ident(TARGET_SCHEMA)}.{quote_ident(table_name)} ADD FOREIGN KEY ({fk_cols}) REFERENCES {quote_ident(TARGET_SCHEMA)}.{quote_ident(ref_table)} ({ref_cols}) {ref_options};'
+                    fk_constraint = f'ALTER TABLE {quote_ident(schema)}.{quote_ident(table_name)} ADD FOREIGN KEY ({fk_cols}) REFERENCES {quote_ident(schema)}.{quote_ident(ref_table)} ({ref_cols}) {ref_options};'
                     inline_constraints.append(fk_constraint)
                 # Don't add to column_lines - this will be handled separately
             else:
                 # fallback: put as comment so it doesn't break
                 column_lines.append(f'-- SKIPPED: {lp}')
-    # Deduplicate inline_index_defs
-    inline_index_defs = list(dict.fromkeys(inline_index_defs))
-
     # Build CREATE TABLE statement
     create_lines = []
-    create_lines.append(f'CREATE TABLE IF NOT EXISTS {quote_ident(TARGET_SCHEMA)}.{quote_ident(table_name)} (')
+    create_lines.append(f'CREATE TABLE IF NOT EXISTS {quote_ident(schema)}.{quote_ident(table_name)} (')
     # join column lines with comma
     for idx, cl in enumerate(column_lines):
         comma = "," if idx != len(column_lines)-1 else ""
@@ -383,42 +389,57 @@ def convert_create_block(block_text, table_autoinc_map):
     # return created SQL, indexes and inline constraints
     return "\n".join(create_lines), inline_index_defs, inline_constraints
 
-def process_alters(alter_blocks, table_autoinc_map):
-    post_statements = []
+def convert_create_block_or_report(block_text, table_autoinc_map, schema):
+    # worker entry point: a block that fails to parse becomes a comment instead of aborting the run
+    try:
+        return convert_create_block(block_text, table_autoinc_map, schema)
+    except Exception as ex:
+        return f'-- ERROR PARSING CREATE BLOCK: {ex}\n-- original block (truncated):\n' + block_text[:300], [], []
+
+def process_alters(alter_blocks):
+    # single pass over the ALTER statements, yielding (kind, payload):
+    #   ("autoinc", (table, column)) for MODIFY ... AUTO_INCREMENT columns
+    #   ("statement", sql) for each converted (or skipped) ALTER
     for a in alter_blocks:
         # normalize whitespace
-        a_clean = re.sub(r"\s+", " ", a).strip().rstrip(";")
+        a_clean = _RE_WHITESPACE.sub(" ", a).strip().rstrip(";")
         # capture table name
-        m = re.match(r"ALTER\s+TABLE\s+`?\"?([^`\" ]+)`?\"?\s+(.*)$", a_clean, flags=re.IGNORECASE)
+        m = _RE_ALTER_HEADER.match(a_clean)
         if not m:
             continue
         tbl = clean_identifier(m.group(1))
         rest = m.group(2).strip()
 
+        # Handle MODIFY ... AUTO_INCREMENT (mark column to become serial); checked before the
+        # other clauses so it is picked up even when combined with them in one ALTER
+        mmod = _RE_MODIFY_AUTO_INCREMENT.search(rest)
+        if mmod:
+            yield "autoinc", (tbl, mmod.group(1))
+
         # Handle ADD PRIMARY KEY
-        mpk = re.search(r"ADD\s+PRIMARY\s+KEY\s*\((.*?)\)", rest, flags=re.IGNORECASE)
+        mpk = _RE_ADD_PRIMARY_KEY.search(rest)
         if mpk:
-            cols = mpk.group(1).replace("`", "").replace('"', "")
-            post_statements.append(f'ALTER TABLE {quote_ident(TARGET_SCHEMA)}.{quote_ident(tbl)} ADD PRIMARY KEY ({cols});')
+            cols = mpk.group(1).translate(_STRIP_QUOTES)
+            yield "statement", f'ALTER TABLE {quote_ident(TARGET_SCHEMA)}.{quote_ident(tbl)} ADD PRIMARY KEY ({cols});'
             continue
 
         # Handle ADD KEY / ADD INDEX / ADD UNIQUE KEY
-        mkey = re.search(r"ADD\s+(UNIQUE\s+KEY|UNIQUE\s+INDEX|KEY|INDEX)\s+`?\"?(\w+)`?\"?\s*\((.*?)\)", rest, flags=re.IGNORECASE)
+        mkey = _RE_ADD_INDEX.search(rest)
         if mkey:
             kind = mkey.group(1)
             idx_name = mkey.group(2)
-            cols = mkey.group(3).replace("`", "").replace('"', "")
+            cols = mkey.group(3).translate(_STRIP_QUOTES)
             unique = "UNIQUE " if "UNIQUE" in kind.upper() else ""
-            post_statements.append(f'CREATE {unique}INDEX IF NOT EXISTS {quote_ident(idx_name)} ON {quote_ident(TARGET_SCHEMA)}.{quote_ident(tbl)} ({cols});')
+            yield "statement", f'CREATE {unique}INDEX IF NOT EXISTS {quote_ident(idx_name)} ON {quote_ident(TARGET_SCHEMA)}.{quote_ident(tbl)} ({cols});'
             continue
 
         # Handle ADD CONSTRAINT ... FOREIGN KEY ... REFERENCES ...
-        mfk = re.search(r'ADD\s+CONSTRAINT\s+`?\"?(\w+)`?\"?\s+FOREIGN\s+KEY\s*\((.*?)\)\s+REFERENCES\s+`?\"?(\w+)`?\"?\s*\((.*?)\)\s*(ON DELETE\s+\w+)?\s*(ON UPDATE\s+\w+)?', rest, flags=re.IGNORECASE)
+        mfk = _RE_ADD_FOREIGN_KEY.search(rest)
         if mfk:
             cname = mfk.group(1)
-            cols = mfk.group(2).replace("`", "").replace('"', "")
+            cols = mfk.group(2).translate(_STRIP_QUOTES)
             ref_table = mfk.group(3)
-            ref_cols = mfk.group(4).replace("`", "").replace('"', "")
+            ref_cols = mfk.group(4).translate(_STRIP_QUOTES)
             ondel = (mfk.group(5) or "").strip()
             onupd = (mfk.group(6) or "").strip()
             
@@ -426,102 +447,107 @@ def process_alters(alter_blocks, table_autoinc_map):
             if ref_table == "registrations":
                 ref_table = "users"
             
-            post_statements.append(
+            yield "statement", (
                 f'ALTER TABLE {quote_ident(TARGET_SCHEMA)}.{quote_ident(tbl)} ADD CONSTRAINT {quote_ident(cname)} FOREIGN KEY ({cols}) REFERENCES {quote_ident(TARGET_SCHEMA)}.{quote_ident(ref_table)} ({ref_cols}) {ondel} {onupd};'
             )
             continue
 
-        # Handle MODIFY ... AUTO_INCREMENT (mark column to become serial)
-        mmod = re.search(r"MODIFY\s+`?\"?(\w+)`?\"?\s+([^\;]+AUTO_INCREMENT)", rest, flags=re.IGNORECASE)
         if mmod:
-            col = mmod.group(1)
-            # mark table_autoinc_map so CREATE conversion will create SERIAL instead
-            table_autoinc_map.setdefault(tbl, set()).add(col)
             # no immediate statement emitted; conversion will be handled in CREATE
             continue
 
         # If none matched, comment it out safely
-        post_statements.append(f'-- SKIPPED ALTER: {a_clean}')
-    return post_statements
+        yield "statement", f'-- SKIPPED ALTER: {a_clean}'
 
 def main():
-    # read all files and merge into a single string (order matters a bit; sort filenames)
-    files = sorted([f for f in os.listdir(INPUT_DIR) if f.endswith(".sql")])
-    if not files:
+    # read files one at a time (order matters a bit; sort filenames)
+    with os.scandir(INPUT_DIR) as it:
+        entries = sorted((e for e in it if e.name.endswith(".sql") and e.is_file()), key=lambda e: e.name)
+    if not entries:
         print(f"[!] No .sql files found in {INPUT_DIR}")
         return
 
-    merged = ""
-    for fn in files:
-        path = os.path.join(INPUT_DIR, fn)
-        with open(path, "r", encoding="utf-8") as fh:
-            merged += "\n\n-- file: " + fn + "\n" + fh.read() + "\n\n"
-
-    merged = remove_mysql_noise(merged)
+    # split each file as it is read, keeping only CREATE TABLE blocks and ALTER TABLE
+    # statements; INSERT data and other statements are dropped with the file text, so
+    # only the kept statements are cleaned of noise
+    create_blocks = []
+    alters = []
+    for entry in entries:
+        with open(entry.path, "r", encoding="utf-8") as fh:
+            sql = fh.read()
+        for kind, text in scan_statements(sql):
+            text = remove_mysql_noise(text)
+            if kind == "create":
+                create_blocks.append(text)
+            else:
+                alters.append(text)
+        del sql
 
-    # find ALTER TABLE statements first to detect MODIFY AUTO_INCREMENT markers
-    alters = find_alter_statements(merged)
+    # process alters first: the same pass yields the final ALTER / INDEX / FK statements
+    # and the MODIFY AUTO_INCREMENT columns the CREATE conversion needs
     table_autoinc_map = {}
-    # quick scan to mark auto-increment columns from ALTER MODIFY lines
-    for a in alters:
-        mmod = re.search(r"MODIFY\s+`?\"?(\w+)`?\"?\s+[^\;]*AUTO_INCREMENT", a, flags=re.IGNORECASE)
-        if mmod:
-            # find tablename
-            mt = re.match(r"ALTER\s+TABLE\s+`?\"?([^`\" ]+)`?\"?", a, flags=re.IGNORECASE)
-            if mt:
-                tbl = clean_identifier(mt.group(1))
-                col = mmod.group(1)
-                table_autoinc_map.setdefault(tbl, set()).add(col)
-
-    # extract CREATE TABLE blocks
-    create_blocks = find_create_table_blocks(merged)
+    post_alter_stmts = []
+    for kind, payload in process_alters(alters):
+        if kind == "autoinc":
+            tbl, col = payload
+            table_autoinc_map.setdefault(tbl, set()).add(col)
+        else:
+            post_alter_stmts.append(payload)
 
     created_sql_list = []
     all_index_stmts = []
     all_inline_constraints = []
 
-    for start, end, block_text in create_blocks:
+    # blocks convert independently, so spread large schemas over worker processes (results keep
+    # input order); small ones, single-CPU machines and a pool that can't run are done in-process
+    # settings are passed in rather than read from globals: spawned workers re-import the module
+    convert = partial(convert_create_block_or_report, table_autoinc_map=table_autoinc_map, schema=TARGET_SCHEMA)
+    results = None
+    if len(create_blocks) >= PARALLEL_MIN_BLOCKS and (os.cpu_count() or 1) > 1:
         try:
-            created_sql, inline_indexes, inline_constraints = convert_create_block(block_text, table_autoinc_map)
-            created_sql_list.append(created_sql)
-            all_index_stmts.extend(inline_indexes)
-            all_inline_constraints.extend(inline_constraints)
-        except Exception as ex:
-            created_sql_list.append(f'-- ERROR PARSING CREATE BLOCK: {ex}\n-- original block (truncated):\n' + block_text[:300])
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(convert, create_blocks, chunksize=8))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            results = None
+    if results is None:
+        results = map(convert, create_blocks)
+
+    for created_sql, inline_indexes, inline_constraints in results:
+        if created_sql is None:
+            # no column list to convert (CREATE TABLE ... LIKE / ... AS SELECT): skip it
             continue
+        created_sql_list.append(created_sql)
+        all_index_stmts.extend(inline_indexes)
+        all_inline_constraints.extend(inline_constraints)
 
-    # process alters into final ALTER / INDEX / FK statements
-    post_alter_stmts = process_alters(alters, table_autoinc_map)
-
-    # Build final output
-    out_lines = []
-    out_lines.append(f'CREATE SCHEMA IF NOT EXISTS {quote_ident(TARGET_SCHEMA)};')
-    out_lines.append(f'SET search_path TO {quote_ident(TARGET_SCHEMA)};')
-    out_lines.append("\n-- ===== CREATE TABLES =====\n")
-    out_lines.extend(created_sql_list)
-    
     # Separate primary key additions from other ALTER statements
     primary_key_stmts = []
     other_alter_stmts = []
-    
+
     for stmt in post_alter_stmts:
         if "ADD PRIMARY KEY" in stmt:
             primary_key_stmts.append(stmt)
         else:
             other_alter_stmts.append(stmt)
-    
-    out_lines.append("\n-- ===== ADD PRIMARY KEYS =====\n")
-    out_lines.extend(primary_key_stmts)
-    out_lines.append("\n-- ===== INDEXES from inline definitions =====\n")
-    out_lines.extend(all_index_stmts)
-    out_lines.append("\n-- ===== INLINE CONSTRAINTS (ENUM CHECKS, etc.) =====\n")
-    out_lines.extend(all_inline_constraints)
-    out_lines.append("\n-- ===== OTHER ALTER / FK =====\n")
-    out_lines.extend(other_alter_stmts)
-
-    # write output
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as out:
-        out.write("\n\n".join(out_lines))
+
+    sections = [
+        ("CREATE TABLES", created_sql_list),
+        ("ADD PRIMARY KEYS", primary_key_stmts),
+        ("INDEXES from inline definitions", all_index_stmts),
+        ("INLINE CONSTRAINTS (ENUM CHECKS, etc.)", all_inline_constraints),
+        ("OTHER ALTER / FK", other_alter_stmts),
+    ]
+
+    # write output statement by statement (blank line between entries) instead of
+    # joining everything into one string first
+    with open(OUTPUT_FILE, "w", encoding="utf-8", buffering=1 << 20) as out:
+        out.write(f'CREATE SCHEMA IF NOT EXISTS {quote_ident(TARGET_SCHEMA)};')
+        out.write(f'\n\nSET search_path TO {quote_ident(TARGET_SCHEMA)};')
+        for title, stmts in sections:
+            out.write(f"\n\n\n-- ===== {title} =====\n")
+            for stmt in stmts:
+                out.write("\n\n")
+                out.write(stmt)
 
     print(f"[OK] Written Postgres schema to: {OUTPUT_FILE}")
     print("  - Review enum CHECK constraints and ON UPDATE semantics.")